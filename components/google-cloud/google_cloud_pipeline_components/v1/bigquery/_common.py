@@ -0,0 +1,57 @@
+# Copyright 2022 The Kubeflow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared placeholder helpers for Google Cloud Pipeline BigQuery components."""
+
+import functools
+from typing import Tuple
+
+from kfp.dsl import ConcatPlaceholder
+
+# Static fragments of the `--payload` Concat shared by the BigQuery job
+# components: {"configuration": {"query": <config>, "labels": <labels>}}
+PAYLOAD_HEAD = '{"configuration": {"query": '
+PAYLOAD_MID = ', "labels": '
+PAYLOAD_TAIL = '}}'
+
+# Static fragments of the `destination_encryption_configuration` clause of the
+# `--job_configuration_query_override` Concat.
+KMS_PREFIX = ', "destination_encryption_configuration": {"kmsKeyName": "'
+KMS_SUFFIX = '"}'
+
+
+@functools.lru_cache(maxsize=1)
+def model_name_concat() -> ConcatPlaceholder:
+  """Returns the `project.dataset.model` name of the `model` input artifact.
+
+  Returns:
+    ConcatPlaceholder joining the projectId, datasetId and modelId metadata of
+    the `model` input artifact with dots.
+  """
+  return ConcatPlaceholder([
+      "{{$.inputs.artifacts['model'].metadata['projectId']}}", '.',
+      "{{$.inputs.artifacts['model'].metadata['datasetId']}}", '.',
+      "{{$.inputs.artifacts['model'].metadata['modelId']}}"
+  ])
+
+
+def kms_frags(encryption_spec_key_name: str) -> Tuple[str, str, str]:
+  """Returns the Concat items of a destination_encryption_configuration clause.
+
+  Args:
+    encryption_spec_key_name: Placeholder of the Cloud KMS key input.
+
+  Returns:
+    Items setting destination_encryption_configuration.kmsKeyName to the key.
+  """
+  return (KMS_PREFIX, encryption_spec_key_name, KMS_SUFFIX)
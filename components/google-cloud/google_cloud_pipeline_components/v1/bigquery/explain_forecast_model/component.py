@@ -16,6 +16,7 @@ from typing import Dict, List
 
 from google_cloud_pipeline_components.types.artifact_types import BQMLModel
 from google_cloud_pipeline_components.types.artifact_types import BQTable
+from google_cloud_pipeline_components.v1.bigquery import _common
 from kfp.dsl import ConcatPlaceholder
 from kfp.dsl import container_component
 from kfp.dsl import ContainerSpec
@@ -23,6 +24,11 @@ from kfp.dsl import Input
 from kfp.dsl import Output
 from kfp.dsl import OutputPath
 
+_EXPLAIN_FORECAST_ARGS_PREFIX = ('--type', 'BigqueryExplainForecastModelJob',
+                                 '--project')
+# Static fragments of the `--job_configuration_query_override` Concat.
+_OVERRIDE_HEAD = '{"query_parameters": '
+
 
 @container_component
 def bigquery_explain_forecast_model_job(
@@ -98,32 +104,25 @@ def bigquery_explain_forecast_model_job(
           'google_cloud_pipeline_components.container.v1.bigquery.explain_forecast_model.launcher'
       ],
       args=[
-          '--type',
-          'BigqueryExplainForecastModelJob',
-          '--project',
+          *_EXPLAIN_FORECAST_ARGS_PREFIX,
           project,
           '--location',
           location,
           '--model_name',
-          ConcatPlaceholder([
-              "{{$.inputs.artifacts['model'].metadata['projectId']}}", '.',
-              "{{$.inputs.artifacts['model'].metadata['datasetId']}}", '.',
-              "{{$.inputs.artifacts['model'].metadata['modelId']}}"
-          ]),
+          _common.model_name_concat(),
           '--horizon',
           horizon,
           '--confidence_level',
           confidence_level,
           '--payload',
           ConcatPlaceholder([
-              '{', '"configuration": {', '"query": ', job_configuration_query,
-              ', "labels": ', labels, '}', '}'
+              _common.PAYLOAD_HEAD, job_configuration_query,
+              _common.PAYLOAD_MID, labels, _common.PAYLOAD_TAIL
           ]),
           '--job_configuration_query_override',
           ConcatPlaceholder([
-              '{', '"query_parameters": ', query_parameters,
-              ', "destination_encryption_configuration": {', '"kmsKeyName": "',
-              encryption_spec_key_name, '"}', '}'
+              _OVERRIDE_HEAD, query_parameters,
+              *_common.kms_frags(encryption_spec_key_name), '}'
           ]),
           '--gcp_resources',
           gcp_resources,
@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List
+from typing import Dict
 
 from google_cloud_pipeline_components.types.artifact_types import BQMLModel
+from google_cloud_pipeline_components.v1.bigquery import _common
 from kfp.dsl import ConcatPlaceholder
 from kfp.dsl import container_component
 from kfp.dsl import ContainerSpec
 from kfp.dsl import Input
 from kfp.dsl import OutputPath
 
+_EXPORT_MODEL_ARGS_PREFIX = ('--type', 'BigqueryExportModelJob', '--project')
+
 
 @container_component
 def bigquery_export_model_job(
@@ -72,24 +75,18 @@ def bigquery_export_model_job(
           'google_cloud_pipeline_components.container.v1.bigquery.export_model.launcher'
       ],
       args=[
-          '--type',
-          'BigqueryExportModelJob',
-          '--project',
+          *_EXPORT_MODEL_ARGS_PREFIX,
           project,
           '--location',
           location,
           '--model_name',
-          ConcatPlaceholder([
-              "{{$.inputs.artifacts['model'].metadata['projectId']}}", '.',
-              "{{$.inputs.artifacts['model'].metadata['datasetId']}}", '.',
-              "{{$.inputs.artifacts['model'].metadata['modelId']}}"
-          ]),
+          _common.model_name_concat(),
           '--model_destination_path',
           model_destination_path,
           '--payload',
           ConcatPlaceholder([
-              '{', '"configuration": {', '"query": ', job_configuration_extract,
-              ', "labels": ', labels, '}', '}'
+              _common.PAYLOAD_HEAD, job_configuration_extract,
+              _common.PAYLOAD_MID, labels, _common.PAYLOAD_TAIL
           ]),
           '--exported_model_path',
           exported_model_path,
@@ -15,12 +15,18 @@
 from typing import Dict, List
 
 from google_cloud_pipeline_components.types.artifact_types import BQTable
+from google_cloud_pipeline_components.v1.bigquery import _common
 from kfp.dsl import ConcatPlaceholder
 from kfp.dsl import container_component
 from kfp.dsl import ContainerSpec
 from kfp.dsl import Output
 from kfp.dsl import OutputPath
 
+_QUERY_JOB_ARGS_PREFIX = ('--type', 'BigqueryQueryJob', '--project')
+# Static fragments of the `--job_configuration_query_override` Concat.
+_OVERRIDE_HEAD = '{"query": "'
+_OVERRIDE_QUERY_PARAMETERS = '", "query_parameters": '
+
 
 @container_component
 def bigquery_query_job(
@@ -88,22 +94,20 @@ def bigquery_query_job(
           'google_cloud_pipeline_components.container.v1.bigquery.query_job.launcher'
       ],
       args=[
-          '--type',
-          'BigqueryQueryJob',
-          '--project',
+          *_QUERY_JOB_ARGS_PREFIX,
           project,
           '--location',
           location,
           '--payload',
           ConcatPlaceholder([
-              '{', '"configuration": {', '"query": ', job_configuration_query,
-              ', "labels": ', labels, '}', '}'
+              _common.PAYLOAD_HEAD, job_configuration_query,
+              _common.PAYLOAD_MID, labels, _common.PAYLOAD_TAIL
           ]),
           '--job_configuration_query_override',
           ConcatPlaceholder([
-              '{', '"query": "', query, '"', ', "query_parameters": ',
-              query_parameters, ', "destination_encryption_configuration": {',
-              '"kmsKeyName": "', encryption_spec_key_name, '"}', '}'
+              _OVERRIDE_HEAD, query, _OVERRIDE_QUERY_PARAMETERS,
+              query_parameters, *_common.kms_frags(encryption_spec_key_name),
+              '}'
           ]),
           '--gcp_resources',
           gcp_resources,
@@ -16,6 +16,9 @@ from kfp.dsl import container_component
 from kfp.dsl import ContainerSpec
 from kfp.dsl import OutputPath
 
+_WAIT_ARGS_PREFIX = ('--type', 'Wait', '--project', '', '--location', '',
+                     '--payload')
+
 
 @container_component
 def wait_gcp_resources(
@@ -60,13 +63,7 @@ def wait_gcp_resources(
           'google_cloud_pipeline_components.container.v1.wait_gcp_resources.launcher'
       ],
       args=[
-          '--type',
-          'Wait',
-          '--project',
-          '',
-          '--location',
-          '',
-          '--payload',
+          *_WAIT_ARGS_PREFIX,
           input_gcp_resources,
           '--gcp_resources',
           gcp_resources,
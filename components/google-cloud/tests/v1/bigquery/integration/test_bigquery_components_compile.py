@@ -0,0 +1,143 @@
+# Copyright 2022 The Kubeflow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test v1 BigQuery components to ensure their args compile to expected JSON."""
+
+import json
+import os
+import re
+import unittest
+
+from google_cloud_pipeline_components.v1.bigquery import BigqueryExplainForecastModelJobOp
+from google_cloud_pipeline_components.v1.bigquery import BigqueryExportModelJobOp
+from google_cloud_pipeline_components.v1.bigquery import BigqueryQueryJobOp
+from kfp import compiler
+import yaml
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\$\.inputs\.(?:parameters\['(\w+)'\]|"
+                             r"artifacts\['model'\]\.metadata\['(\w+)'\])\}\}")
+
+
+class ComponentsCompileTest(unittest.TestCase):
+
+  def setUp(self):
+    super(ComponentsCompileTest, self).setUp()
+    self._parameters = {
+        'project': 'test_project',
+        'location': 'us-central1',
+        'model_destination_path': 'gs://foo',
+        'horizon': 3,
+        'confidence_level': 0.95,
+        'query': 'SELECT * FROM foo_bar;',
+        'query_parameters': [{'name': 'foo'}, {'name': 'bar'}],
+        'job_configuration_query': {'priority': 'high'},
+        'job_configuration_extract': {'destinationUris': ['gs://foo']},
+        'labels': {'key1': 'val1'},
+        'encryption_spec_key_name': 'fake_encryption_key',
+    }
+    self._model_metadata = {
+        'projectId': 'test_project',
+        'datasetId': 'test_dataset',
+        'modelId': 'test_model',
+    }
+    self._package_path = os.path.join(
+        os.getenv('TEST_UNDECLARED_OUTPUTS_DIR'), 'component.yaml')
+
+  def tearDown(self):
+    super(ComponentsCompileTest, self).tearDown()
+    if os.path.exists(self._package_path):
+      os.remove(self._package_path)
+
+  def _resolve(self, arg):
+    """Resolves a compiled arg the way the backend fills in the placeholders."""
+    if arg.startswith('{"Concat": '):
+      arg = ''.join(json.loads(arg)['Concat'])
+
+    def replace(match):
+      parameter, metadata_key = match.groups()
+      if metadata_key:
+        return self._model_metadata[metadata_key]
+      value = self._parameters[parameter]
+      return value if isinstance(value, str) else json.dumps(value)
+
+    return _PLACEHOLDER_RE.sub(replace, arg)
+
+  def _compile_args(self, component):
+    """Compiles the component and returns its resolved args by flag."""
+    compiler.Compiler().compile(component, package_path=self._package_path)
+    with open(self._package_path) as f:
+      pipeline_spec = yaml.safe_load(f)
+    (executor,) = pipeline_spec['deploymentSpec']['executors'].values()
+    args = executor['container']['args']
+    return {
+        flag: self._resolve(value) for flag, value in zip(args[::2], args[1::2])
+    }
+
+  def test_bigquery_query_job_op_compile(self):
+    args = self._compile_args(BigqueryQueryJobOp)
+
+    self.assertEqual(args['--type'], 'BigqueryQueryJob')
+    self.assertEqual(
+        json.loads(args['--payload']), {
+            'configuration': {
+                'query': {'priority': 'high'},
+                'labels': {'key1': 'val1'},
+            }
+        })
+    self.assertEqual(
+        json.loads(args['--job_configuration_query_override']), {
+            'query': 'SELECT * FROM foo_bar;',
+            'query_parameters': [{'name': 'foo'}, {'name': 'bar'}],
+            'destination_encryption_configuration': {
+                'kmsKeyName': 'fake_encryption_key'
+            },
+        })
+
+  def test_bigquery_explain_forecast_model_job_op_compile(self):
+    args = self._compile_args(BigqueryExplainForecastModelJobOp)
+
+    self.assertEqual(args['--type'], 'BigqueryExplainForecastModelJob')
+    self.assertEqual(args['--model_name'],
+                     'test_project.test_dataset.test_model')
+    self.assertEqual(
+        json.loads(args['--payload']), {
+            'configuration': {
+                'query': {'priority': 'high'},
+                'labels': {'key1': 'val1'},
+            }
+        })
+    self.assertEqual(
+        json.loads(args['--job_configuration_query_override']), {
+            'query_parameters': [{'name': 'foo'}, {'name': 'bar'}],
+            'destination_encryption_configuration': {
+                'kmsKeyName': 'fake_encryption_key'
+            },
+        })
+
+  def test_bigquery_export_model_job_op_compile(self):
+    args = self._compile_args(BigqueryExportModelJobOp)
+
+    self.assertEqual(args['--type'], 'BigqueryExportModelJob')
+    self.assertEqual(args['--model_name'],
+                     'test_project.test_dataset.test_model')
+    self.assertEqual(
+        json.loads(args['--payload']), {
+            'configuration': {
+                'query': {'destinationUris': ['gs://foo']},
+                'labels': {'key1': 'val1'},
+            }
+        })
+
+
+if __name__ == '__main__':
+  unittest.main()